@@ -10,25 +10,133 @@ Author: Syracuse University
 Version: 1.0
 """
 
-import requests
+import functools
+import hashlib
+import json
+import mimetypes
+import mmap
 import os
+import random
+import re
+import stat
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, List
 import logging
 import argparse
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('document_upload.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+try:
+    # orjson is optional; it decodes responses several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# requests and its dependencies take a noticeable time to import, so they
+# are imported where they are used. This keeps --help and validation
+# failures fast.
+if TYPE_CHECKING:
+    import requests
+    from requests_toolbelt.multipart.encoder import MultipartEncoderMonitor
+
 logger = logging.getLogger(__name__)
 
+# Connections kept open by the shared session. Also the upper bound on
+# parallel uploads, since extra workers would have their keep-alive
+# connections discarded when the pool is full.
+SESSION_POOL_SIZE = 8
+
+# Shared session so keep-alive connections and TLS sessions are reused
+# across uploads; created on first use by _get_session()
+_session: Optional['requests.Session'] = None
+_session_lock = threading.Lock()
+
+
+# Environment variable checked for the API key before the credentials file
+API_KEY_ENV_VAR = 'MENTORAI_API_KEY'
+
+# Default number of files uploaded in parallel; kept small to respect
+# server limits
+MAX_CONCURRENT_UPLOADS = 4
+
+# Upload progress is logged each time another 1/PROGRESS_STEPS of the
+# request body has been sent (every 5%)
+PROGRESS_STEPS = 20
+
+# Timeout in seconds for the best-effort "already uploaded?" lookup; kept
+# short so a slow lookup endpoint doesn't delay the upload itself
+EXISTING_LOOKUP_TIMEOUT = 10
+
+# Transient responses that are worth retrying, with exponential backoff
+RETRY_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 1.0  # seconds; doubled after every failed attempt
+MAX_BACKOFF = 60.0  # cap for our own backoff, not for Retry-After
+MAX_RETRY_AFTER = 300.0  # longer server-requested waits abort instead
+
+# MIME types for the document formats the mentor system is known to accept;
+# other extensions fall back to mimetypes.guess_type
+MIME_TYPES = MappingProxyType({
+    '.pdf': 'application/pdf',
+    '.txt': 'text/plain',
+    '.doc': 'application/msword',
+    '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
+})
+
+# Mentor pathway IDs are canonical UUIDs
+MENTOR_ID_PATTERN = re.compile(
+    r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+)
+
+# Successful upload responses are cached here, keyed by file content and
+# destination, so re-running the script does not re-upload the same document
+# (an empty XDG_CACHE_HOME is treated as unset, per the XDG spec)
+CACHE_DIR = Path(
+    os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+) / 'mentorai'
+
+
+def _get_session() -> 'requests.Session':
+    """
+    Return the shared HTTP session, creating it on first use.
+    
+    Only connection failures are retried by the session: the multipart
+    body is streamed and cannot be replayed once it has been sent, so
+    status based retries are handled by upload_document (see
+    RETRY_STATUS_CODES).
+    
+    Returns:
+        The shared requests.Session
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=SESSION_POOL_SIZE,
+                max_retries=Retry(
+                    total=5,
+                    connect=5,
+                    read=0,
+                    status=0,
+                    backoff_factor=0.5,
+                    allowed_methods=['POST']
+                )
+            )
+            session = requests.Session()
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+    return _session
+
 
 class DocumentUploadError(Exception):
     """Custom exception for document upload failures"""
@@ -40,6 +148,28 @@ class ConfigurationError(Exception):
     pass
 
 
+def configure_logging(log_file: Optional[str] = 'document_upload.log') -> None:
+    """
+    Configure logging to stdout and, optionally, a log file.
+    
+    Called by main() rather than at import time, so other scripts can
+    import this module without it taking over their logging setup.
+    
+    Args:
+        log_file: Path to the log file, or None to log to stdout only
+    """
+    handlers: List[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+    if log_file:
+        # delay=True: the log file is only opened once something is logged
+        handlers.insert(0, logging.FileHandler(log_file, delay=True))
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
+
+
 def validate_file_path(file_path: str) -> Path:
     """
     Validate that the file exists and is accessible.
@@ -51,22 +181,25 @@ def validate_file_path(file_path: str) -> Path:
         Path object of the validated file
         
     Raises:
-        ConfigurationError: If file doesn't exist or isn't readable
+        ConfigurationError: If file doesn't exist or isn't a regular file
     """
     path = Path(file_path)
     
-    if not path.exists():
+    # A single stat() answers every check below. Readability is not checked
+    # up front: opening the file for upload reports PermissionError itself.
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         raise ConfigurationError(f"File not found: {file_path}")
+    except OSError as e:
+        raise ConfigurationError(f"Cannot access file: {file_path} ({e})")
     
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ConfigurationError(f"Path is not a file: {file_path}")
     
-    if not os.access(path, os.R_OK):
-        raise ConfigurationError(f"File is not readable: {file_path}")
-    
     # Check file size (e.g., max 100MB)
     max_size = 100 * 1024 * 1024  # 100MB in bytes
-    file_size = path.stat().st_size
+    file_size = st.st_size
     if file_size > max_size:
         raise ConfigurationError(
             f"File too large: {file_size / (1024*1024):.2f}MB (max: 100MB)"
@@ -79,6 +212,103 @@ def validate_file_path(file_path: str) -> Path:
     return path
 
 
+def compute_file_sha256(file_path: Path) -> str:
+    """
+    Compute the SHA-256 digest of a file's contents.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        Hex SHA-256 digest
+    """
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: hashed in C without a Python-level read loop
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    digest.update(view)
+        return digest.hexdigest()
+
+
+def compute_cache_key(
+    file_sha256: str,
+    base_url: str,
+    org_id: str,
+    user_id: str,
+    mentor_id: str,
+    access: Optional[str] = None
+) -> str:
+    """
+    Compute the response cache key for an upload.
+    
+    Args:
+        file_sha256: Digest returned by compute_file_sha256
+        base_url: Base URL for the API
+        org_id: Organization ID
+        user_id: User NetID
+        mentor_id: Mentor pathway ID
+        access: Document visibility sent with the upload, if any
+        
+    Returns:
+        Hex SHA-256 digest of the file digest, upload destination and
+        visibility
+    """
+    key = hashlib.sha256(file_sha256.encode('ascii'))
+    for part in (base_url.rstrip('/'), org_id, user_id, mentor_id, access or ''):
+        key.update(b'\0' + part.encode('utf-8'))
+    return key.hexdigest()
+
+
+def load_cached_response(cache_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a previously stored upload response.
+    
+    Args:
+        cache_key: Key returned by compute_cache_key
+        
+    Returns:
+        The cached response data, or None if there is no usable entry
+    """
+    cache_file = CACHE_DIR / f"{cache_key}.json"
+    try:
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable cache entry {cache_file}: {e}")
+        return None
+
+
+def store_cached_response(cache_key: str, result: Dict[str, Any]) -> None:
+    """
+    Atomically store a successful upload response in the cache.
+    
+    Failures are logged and otherwise ignored, since the upload itself
+    has already succeeded.
+    
+    Args:
+        cache_key: Key returned by compute_cache_key
+        result: Response data to store
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(result, f)
+            os.replace(tmp_name, CACHE_DIR / f"{cache_key}.json")
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write upload cache: {e}")
+
+
 def parse_arguments() -> argparse.Namespace:
     """
     Parse command-line arguments.
@@ -95,10 +325,13 @@ Examples:
   %(prog)s -u jasidel -m 25223e76-fc94-4cc2-aec1-f9fb51f0c2bf -f document.pdf
   
   # With custom organization
-  %(prog)s -o myorg -u jsmith -m abc-123-def -f report.pdf
+  %(prog)s -o myorg -u jsmith -m 25223e76-fc94-4cc2-aec1-f9fb51f0c2bf -f report.pdf
   
   # With custom credentials file
-  %(prog)s -u jasidel -m abc-123 -f doc.pdf -c my_api_key.txt
+  %(prog)s -u jasidel -m 25223e76-fc94-4cc2-aec1-f9fb51f0c2bf -f doc.pdf -c my_api_key.txt
+  
+  # Upload several documents in parallel
+  %(prog)s -u jasidel -m 25223e76-fc94-4cc2-aec1-f9fb51f0c2bf -f a.pdf b.pdf c.docx
         """
     )
     
@@ -126,15 +359,17 @@ Examples:
     parser.add_argument(
         '-f', '--file',
         type=str,
+        nargs='+',
         required=True,
-        help='Path to document file to upload (required)'
+        help='Path(s) to document file(s) to upload (required)'
     )
     
     parser.add_argument(
         '-c', '--credentials',
         type=str,
         default='api_credentials.txt',
-        help='Path to API credentials file (default: api_credentials.txt)'
+        help='Path to API credentials file, used when MENTORAI_API_KEY '
+             'is not set (default: api_credentials.txt)'
     )
     
     parser.add_argument(
@@ -151,6 +386,28 @@ Examples:
         help='Request timeout in seconds (default: 300)'
     )
     
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=MAX_CONCURRENT_UPLOADS,
+        help=f'Number of files to upload in parallel, at most '
+             f'{SESSION_POOL_SIZE} (default: {MAX_CONCURRENT_UPLOADS})'
+    )
+    
+    parser.add_argument(
+        '--force', '--no-cache',
+        dest='force',
+        action='store_true',
+        help='Upload even if this file was already uploaded to this mentor'
+    )
+    
+    parser.add_argument(
+        '--assume-idempotent',
+        action='store_true',
+        help='Ask the server whether the file is already trained on the '
+             'mentor and skip the upload if it is'
+    )
+    
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -163,12 +420,20 @@ Examples:
     if args.timeout < 1:
         parser.error("Timeout must be at least 1 second")
     
+    if not 1 <= args.jobs <= SESSION_POOL_SIZE:
+        parser.error(f"Jobs must be between 1 and {SESSION_POOL_SIZE}")
+    
     return args
 
 
+@functools.lru_cache(maxsize=1)
 def load_api_key(credential_file: str = 'api_credentials.txt') -> str:
     """
-    Securely load API key from credentials file.
+    Securely load API key from the environment or credentials file.
+    
+    The MENTORAI_API_KEY environment variable takes precedence, so the
+    credentials file is only read when it is unset. The result is cached,
+    so repeated calls don't touch the disk again.
     
     Args:
         credential_file: Path to the credentials file
@@ -177,32 +442,48 @@ def load_api_key(credential_file: str = 'api_credentials.txt') -> str:
         API key string
         
     Raises:
-        ConfigurationError: If credentials file is missing or invalid
+        ConfigurationError: If no key is set and the credentials file is
+            missing or invalid
     """
+    api_key = os.environ.get(API_KEY_ENV_VAR, '').strip()
+    if api_key:
+        if len(api_key) < 10:
+            raise ConfigurationError(
+                f"API key in {API_KEY_ENV_VAR} appears to be invalid (too short)"
+            )
+        logger.info(f"API key loaded from {API_KEY_ENV_VAR}")
+        return api_key
+    
     cred_path = Path(credential_file)
     
-    if not cred_path.exists():
+    try:
+        raw = cred_path.read_bytes()
+    except FileNotFoundError:
         raise ConfigurationError(
             f"Credentials file not found: {credential_file}\n"
-            f"Please create this file with your API key on the first line."
+            f"Please create this file with your API key on the first line,\n"
+            f"or set the {API_KEY_ENV_VAR} environment variable."
         )
-    
-    try:
-        with open(cred_path, 'r') as f:
-            api_key = f.readline().strip()
-        
-        if not api_key:
-            raise ConfigurationError("API key is empty in credentials file")
-        
-        # Basic validation - check it's not obviously wrong
-        if len(api_key) < 10:
-            raise ConfigurationError("API key appears to be invalid (too short)")
-        
-        logger.info("API key loaded successfully")
-        return api_key
-        
     except IOError as e:
         raise ConfigurationError(f"Error reading credentials file: {e}")
+    
+    try:
+        api_key = raw.split(b'\n', 1)[0].strip().decode('ascii')
+    except UnicodeDecodeError:
+        raise ConfigurationError(
+            "API key contains non-ASCII characters "
+            "(was the credentials file saved with a BOM?)"
+        )
+    
+    if not api_key:
+        raise ConfigurationError("API key is empty in credentials file")
+    
+    # Basic validation - check it's not obviously wrong
+    if len(api_key) < 10:
+        raise ConfigurationError("API key appears to be invalid (too short)")
+    
+    logger.info("API key loaded successfully")
+    return api_key
 
 
 def validate_configuration(
@@ -230,16 +511,344 @@ def validate_configuration(
     if not mentor_id or not isinstance(mentor_id, str):
         raise ConfigurationError("Mentor ID must be a non-empty string")
     
-    # Validate mentor_id format (UUID-like)
-    if len(mentor_id) != 36 or mentor_id.count('-') != 4:
-        logger.warning(
-            f"Mentor ID format looks unusual: {mentor_id}\n"
+    # Validate mentor_id format (UUID) before spending a request on it
+    if not MENTOR_ID_PATTERN.fullmatch(mentor_id):
+        raise ConfigurationError(
+            f"Invalid mentor ID: {mentor_id}\n"
             f"Expected UUID format (e.g., 25223e76-fc94-4cc2-aec1-f9fb51f0c2bf)"
         )
     
     logger.info(f"Configuration validated - Org: {org_id}, User: {user_id}")
 
 
+def _progress_logger(
+    file_name: str
+) -> Callable[['MultipartEncoderMonitor'], None]:
+    """
+    Build a MultipartEncoderMonitor callback that logs upload progress.
+    
+    The monitor calls back for every block read, so the callback only
+    logs when another 5% of the body has been sent, plus once at the end.
+    
+    Args:
+        file_name: File name to include in the progress messages
+        
+    Returns:
+        Callback to pass to MultipartEncoderMonitor
+    """
+    last_logged = 0
+    
+    def log_progress(monitor: 'MultipartEncoderMonitor') -> None:
+        nonlocal last_logged
+        bytes_read, total = monitor.bytes_read, monitor.len
+        if (bytes_read - last_logged >= total // PROGRESS_STEPS
+                or (bytes_read >= total and last_logged < total)):
+            last_logged = bytes_read
+            logger.info(
+                f"{file_name}: {100 * bytes_read / total:.0f}% uploaded "
+                f"({bytes_read / (1024*1024):.1f}/{total / (1024*1024):.1f}MB)"
+            )
+    
+    return log_progress
+
+
+def _retry_delay(response: 'requests.Response', attempt: int) -> float:
+    """
+    Compute how long to wait before retrying a failed upload.
+    
+    Honors the server's Retry-After header when present, otherwise uses
+    exponential backoff with jitter, capped at MAX_BACKOFF, so concurrent
+    clients don't retry in lockstep.
+    
+    Args:
+        response: The response that triggered the retry
+        attempt: Zero-based number of the attempt that just failed
+        
+    Returns:
+        Delay in seconds
+        
+    Raises:
+        DocumentUploadError: If the server asks to wait longer than
+            MAX_RETRY_AFTER
+    """
+    from urllib3.exceptions import InvalidHeader
+    from urllib3.util.retry import Retry
+    
+    retry_after = response.headers.get('Retry-After')
+    if retry_after:
+        try:
+            delay = Retry().parse_retry_after(retry_after)
+        except InvalidHeader:
+            logger.debug(f"Ignoring invalid Retry-After header: {retry_after}")
+        else:
+            # The server's value is used as-is, since retrying sooner would
+            # only burn an attempt; waits too long to sit through are
+            # reported instead
+            if delay > MAX_RETRY_AFTER:
+                retry_at = time.strftime(
+                    '%H:%M:%S', time.localtime(time.time() + delay)
+                )
+                raise DocumentUploadError(
+                    f"Server returned status {response.status_code} and asked "
+                    f"to wait {delay:.0f} seconds; try again after {retry_at}"
+                )
+            return delay
+    
+    delay = min(BACKOFF_FACTOR * 2 ** attempt, MAX_BACKOFF)
+    return random.uniform(delay / 2, delay)
+
+
+class DocumentUploader:
+    """
+    Uploads documents for one user, reusing the URL, headers and session.
+    
+    The endpoint URL and authentication headers are built once, so a batch
+    of uploads only varies the file and mentor per request. A single
+    instance can be shared between threads.
+    
+    Args:
+        org_id: Organization ID
+        user_id: User NetID
+        api_key: API authentication key
+        base_url: Base URL for the API
+        timeout: Request timeout in seconds
+        use_cache: Return the stored response if an upload already
+            succeeded, and store the response on success
+        assume_idempotent: Before uploading, ask the server whether a
+            file is already trained on the mentor and skip the upload if so
+        session: HTTP session to use; defaults to the shared session
+    """
+    
+    def __init__(
+        self,
+        org_id: str,
+        user_id: str,
+        api_key: str,
+        base_url: str = "https://base.manager.ai.syr.edu",
+        timeout: int = 300,  # 5 minutes
+        use_cache: bool = True,
+        assume_idempotent: bool = False,
+        session: Optional['requests.Session'] = None
+    ) -> None:
+        self.base_url = base_url
+        self.org_id = org_id
+        self.user_id = user_id
+        self.timeout = timeout
+        self.use_cache = use_cache
+        self.assume_idempotent = assume_idempotent
+        self.session = session if session is not None else _get_session()
+        
+        documents_url = f"{base_url}/api/ai-index/orgs/{org_id}/users/{user_id}/documents/"
+        self.url = f"{documents_url}train/"
+        self.lookup_url = documents_url
+        self.headers = {
+            'Authorization': f'Api-Token {api_key}'
+        }
+    
+    def _check_existing(self, mentor_id: str, file_sha256: str) -> Optional[str]:
+        """
+        Ask the server whether this file is already trained on the mentor.
+        
+        This is a best-effort lookup: any failure or unexpected response is
+        treated as "not found" so the caller falls back to a normal upload.
+        
+        Args:
+            mentor_id: Mentor pathway ID
+            file_sha256: Digest returned by compute_file_sha256
+            
+        Returns:
+            The existing document ID, or None if the document must be uploaded
+        """
+        import requests
+        
+        try:
+            response = self.session.get(
+                self.lookup_url,
+                headers=self.headers,
+                params={'pathway': mentor_id, 'hash': file_sha256},
+                timeout=min(self.timeout, EXISTING_LOOKUP_TIMEOUT)
+            )
+            if response.status_code != 200:
+                logger.debug(
+                    f"Existing document lookup returned {response.status_code}"
+                )
+                return None
+            payload = json_loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.debug(f"Existing document lookup failed: {e}")
+            return None
+        
+        if isinstance(payload, dict) and payload.get('document_id'):
+            return str(payload['document_id'])
+        return None
+    
+    def upload(
+        self,
+        file_path: Path,
+        mentor_id: str,
+        access: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Upload and train a document to the mentor system.
+        
+        Args:
+            file_path: Path to the document file
+            mentor_id: Mentor pathway ID
+            access: Document visibility (e.g. 'private'); the server default
+                is used when omitted
+            
+        Returns:
+            Dictionary containing the response data
+            
+        Raises:
+            DocumentUploadError: If upload fails
+        """
+        import requests
+        from requests_toolbelt.multipart.encoder import (
+            MultipartEncoder, MultipartEncoderMonitor
+        )
+        
+        file_sha256 = None
+        if self.use_cache or self.assume_idempotent:
+            try:
+                file_sha256 = compute_file_sha256(file_path)
+            except OSError as e:
+                raise DocumentUploadError(f"Could not read file: {e}")
+        
+        cache_key = None
+        if self.use_cache:
+            cache_key = compute_cache_key(
+                file_sha256, self.base_url, self.org_id, self.user_id,
+                mentor_id, access
+            )
+            cached = load_cached_response(cache_key)
+            if cached is not None:
+                logger.info(f"Cache hit for {file_path.name}, skipping upload")
+                logger.info(f"Document ID: {cached.get('document_id', 'N/A')}")
+                return cached
+        
+        if self.assume_idempotent:
+            document_id = self._check_existing(mentor_id, file_sha256)
+            if document_id is not None:
+                logger.info(
+                    f"Server-side cache hit for {file_path.name}, skipping upload"
+                )
+                logger.info(f"Document ID: {document_id}")
+                result = {'document_id': document_id}
+                if cache_key is not None:
+                    store_cached_response(cache_key, result)
+                return result
+        
+        # Determine MIME type based on extension
+        file_extension = file_path.suffix.lower()
+        mime_type = (
+            MIME_TYPES.get(file_extension)
+            or mimetypes.guess_type(file_path.name)[0]
+            or 'application/octet-stream'
+        )
+        
+        if mime_type == 'application/octet-stream':
+            logger.warning(f"Unknown file type: {file_extension}, using generic MIME type")
+        
+        # Document type for API - always use 'file' to match browser behavior
+        doc_type = 'file'
+        
+        logger.info(f"Uploading document: {file_path.name}")
+        logger.info(f"Target URL: {self.url}")
+        logger.info(f"Document type: {doc_type}, MIME type: {mime_type}")
+        
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                # The file is reopened on every attempt because the streamed
+                # body of a failed attempt has already been consumed
+                with open(file_path, 'rb') as f:
+                    # Stream the multipart body from the file handle instead of
+                    # building the whole payload in memory before sending
+                    fields = {
+                        'pathway': mentor_id,
+                        'type': doc_type,
+                        'name': file_path.name,
+                        'file': (file_path.name, f, mime_type)
+                    }
+                    if access is not None:
+                        fields['access'] = access
+                    monitor = MultipartEncoderMonitor(
+                        MultipartEncoder(fields=fields),
+                        _progress_logger(file_path.name)
+                    )
+                    
+                    # requests sets Content-Length from monitor.len, so the
+                    # streamed body is sent fixed-length rather than chunked
+                    response = self.session.post(
+                        self.url,
+                        headers={
+                            **self.headers,
+                            'Content-Type': monitor.content_type
+                        },
+                        data=monitor,
+                        timeout=self.timeout
+                    )
+                
+                if (response.status_code not in RETRY_STATUS_CODES
+                        or attempt == MAX_RETRIES):
+                    break
+                
+                delay = _retry_delay(response, attempt)
+                logger.warning(
+                    f"Upload attempt {attempt + 1} failed with status "
+                    f"{response.status_code}, retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+            
+            # Decode the body once; both the success and error paths use it
+            body = response.content
+            try:
+                payload = json_loads(body)
+            except ValueError:
+                payload = None
+            
+            # Check response status
+            if response.status_code in [200, 201]:
+                if isinstance(payload, dict):
+                    result = payload
+                    logger.info("Upload successful!")
+                else:
+                    # The document was accepted, so don't report a failure
+                    # that would invite the user to upload it again
+                    logger.warning(
+                        f"Upload accepted (status {response.status_code}) but "
+                        f"the response was not a JSON object; document ID unknown"
+                    )
+                    result = {}
+                logger.info(f"Document ID: {result.get('document_id', 'N/A')}")
+                if cache_key is not None:
+                    store_cached_response(cache_key, result)
+                return result
+            else:
+                error_msg = f"Upload failed with status {response.status_code}"
+                if payload is not None:
+                    error_msg += f"\nDetails: {payload}"
+                else:
+                    error_msg += f"\nResponse: {body.decode('utf-8', errors='replace')}"
+                
+                logger.error(error_msg)
+                raise DocumentUploadError(error_msg)
+        
+        except requests.exceptions.Timeout:
+            raise DocumentUploadError(
+                f"Upload timed out after {self.timeout} seconds. "
+                f"The file may be too large or the server is slow to respond."
+            )
+        except requests.exceptions.ConnectionError as e:
+            raise DocumentUploadError(f"Connection error: {e}")
+        except requests.exceptions.RequestException as e:
+            raise DocumentUploadError(f"Request failed: {e}")
+        except OSError as e:
+            # e.g. PermissionError when opening the file; listed after the
+            # requests exceptions, which are OSError subclasses too
+            raise DocumentUploadError(f"Could not read file: {e}")
+
+
 def upload_document(
     org_id: str,
     user_id: str,
@@ -247,10 +856,16 @@ def upload_document(
     file_path: Path,
     api_key: str,
     base_url: str = "https://base.manager.ai.syr.edu",
-    timeout: int = 300  # 5 minutes
+    timeout: int = 300,  # 5 minutes
+    use_cache: bool = True,
+    assume_idempotent: bool = False,
+    access: Optional[str] = None
 ) -> Dict[str, Any]:
     """
-    Upload and train a document to the mentor system.
+    Upload and train a single document to the mentor system.
+    
+    Convenience wrapper around DocumentUploader for one-off uploads; use
+    DocumentUploader directly when uploading several files.
     
     Args:
         org_id: Organization ID
@@ -260,6 +875,10 @@ def upload_document(
         api_key: API authentication key
         base_url: Base URL for the API
         timeout: Request timeout in seconds
+        use_cache: See DocumentUploader
+        assume_idempotent: See DocumentUploader
+        access: Document visibility (e.g. 'private'); the server default
+            is used when omitted
         
     Returns:
         Dictionary containing the response data
@@ -267,80 +886,103 @@ def upload_document(
     Raises:
         DocumentUploadError: If upload fails
     """
-    # Construct URL
-    url = f"{base_url}/api/ai-index/orgs/{org_id}/users/{user_id}/documents/train/"
-    
-    # Prepare headers
-    headers = {
-        'Authorization': f'Api-Token {api_key}'
-    }
-    
-    # Determine MIME type based on extension
-    mime_types = {
-        '.pdf': 'application/pdf',
-        '.txt': 'text/plain',
-        '.doc': 'application/msword',
-        '.docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document'
-    }
+    uploader = DocumentUploader(
+        org_id=org_id,
+        user_id=user_id,
+        api_key=api_key,
+        base_url=base_url,
+        timeout=timeout,
+        use_cache=use_cache,
+        assume_idempotent=assume_idempotent
+    )
+    return uploader.upload(file_path, mentor_id, access=access)
+
+
+def upload_documents(
+    org_id: str,
+    user_id: str,
+    mentor_id: str,
+    file_paths: List[Path],
+    api_key: str,
+    base_url: str = "https://base.manager.ai.syr.edu",
+    timeout: int = 300,
+    use_cache: bool = True,
+    assume_idempotent: bool = False,
+    max_workers: int = MAX_CONCURRENT_UPLOADS
+) -> List[Dict[str, Any]]:
+    """
+    Upload several documents concurrently over the shared session.
     
-    file_extension = file_path.suffix.lower()
-    mime_type = mime_types.get(file_extension, 'application/octet-stream')
+    Every file is attempted even if another one fails.
     
-    if mime_type == 'application/octet-stream':
-        logger.warning(f"Unknown file type: {file_extension}, using generic MIME type")
+    Args:
+        org_id: Organization ID
+        user_id: User NetID
+        mentor_id: Mentor pathway ID
+        file_paths: Paths to the document files
+        api_key: API authentication key
+        base_url: Base URL for the API
+        timeout: Request timeout in seconds
+        use_cache: See DocumentUploader
+        assume_idempotent: See DocumentUploader
+        max_workers: Maximum number of uploads in flight at once (capped
+            at SESSION_POOL_SIZE)
+        
+    Returns:
+        Response data for each file, in the order given
+        
+    Raises:
+        DocumentUploadError: If any upload fails
+    """
+    if not file_paths:
+        return []
     
-    # Document type for API - always use 'file' to match browser behavior
-    doc_type = 'file'
+    # One uploader for the whole batch: the URL, headers and session are
+    # built once and only the file differs per request
+    uploader = DocumentUploader(
+        org_id=org_id,
+        user_id=user_id,
+        api_key=api_key,
+        base_url=base_url,
+        timeout=timeout,
+        use_cache=use_cache,
+        assume_idempotent=assume_idempotent
+    )
     
-    logger.info(f"Uploading document: {file_path.name}")
-    logger.info(f"Target URL: {url}")
-    logger.info(f"Document type: {doc_type}, MIME type: {mime_type}")
+    workers = min(max_workers, SESSION_POOL_SIZE, len(file_paths))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = [
+        executor.submit(uploader.upload, path, mentor_id)
+        for path in file_paths
+    ]
     
+    results = []
+    failures = []
     try:
-        with open(file_path, 'rb') as f:
-            files = {
-                'file': (file_path.name, f, mime_type)
-            }
-            data = {
-                'pathway': mentor_id,
-                'type': doc_type,
-                'name': file_path.name
-            }
-            
-            response = requests.post(
-                url,
-                headers=headers,
-                files=files,
-                data=data,
-                timeout=timeout
-            )
-        
-        # Check response status
-        if response.status_code in [200, 201]:
-            result = response.json()
-            logger.info("Upload successful!")
-            logger.info(f"Document ID: {result.get('document_id', 'N/A')}")
-            return result
-        else:
-            error_msg = f"Upload failed with status {response.status_code}"
+        for path, future in zip(file_paths, futures):
             try:
-                error_detail = response.json()
-                error_msg += f"\nDetails: {error_detail}"
-            except:
-                error_msg += f"\nResponse: {response.text}"
-            
-            logger.error(error_msg)
-            raise DocumentUploadError(error_msg)
+                results.append(future.result())
+            except (DocumentUploadError, OSError) as e:
+                failures.append(f"{path.name}: {e}")
+            except Exception as e:
+                # Don't let one unexpected error hide the other uploads' results
+                logger.error(
+                    f"Unexpected error uploading {path.name}: {e}", exc_info=e
+                )
+                failures.append(f"{path.name}: unexpected error: {e}")
+    except BaseException:
+        # e.g. Ctrl-C: drop the queued uploads rather than sending them
+        # anyway; uploads already in flight cannot be interrupted
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
     
-    except requests.exceptions.Timeout:
+    if failures:
         raise DocumentUploadError(
-            f"Upload timed out after {timeout} seconds. "
-            f"The file may be too large or the server is slow to respond."
+            f"{len(failures)} of {len(file_paths)} uploads failed:\n"
+            + "\n".join(failures)
         )
-    except requests.exceptions.ConnectionError as e:
-        raise DocumentUploadError(f"Connection error: {e}")
-    except requests.exceptions.RequestException as e:
-        raise DocumentUploadError(f"Request failed: {e}")
+    return results
 
 
 def main() -> int:
@@ -353,22 +995,26 @@ def main() -> int:
     # Parse command-line arguments
     args = parse_arguments()
     
+    configure_logging()
+    
     # Configure logging level based on verbose flag
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("Verbose logging enabled")
     
-    logger.info("=" * 60)
-    logger.info("Document Upload Script Started")
-    logger.info("=" * 60)
-    
-    # Log configuration (but not sensitive data)
-    logger.info(f"Organization: {args.org_id}")
-    logger.info(f"User: {args.user_id}")
-    logger.info(f"Mentor ID: {args.mentor_id}")
-    logger.info(f"File: {args.file}")
-    logger.info(f"Base URL: {args.base_url}")
-    logger.info(f"Timeout: {args.timeout}s")
+    # Log configuration (but not sensitive data) as a single record
+    banner = "\n".join([
+        "=" * 60,
+        "Document Upload Script Started",
+        "=" * 60,
+        f"Organization: {args.org_id}",
+        f"User: {args.user_id}",
+        f"Mentor ID: {args.mentor_id}",
+        f"Files: {', '.join(args.file)}",
+        f"Base URL: {args.base_url}",
+        f"Timeout: {args.timeout}s",
+    ])
+    logger.info(banner)
     
     try:
         # Validate configuration
@@ -377,23 +1023,28 @@ def main() -> int:
         # Load API credentials
         api_key = load_api_key(args.credentials)
         
-        # Validate file
-        validated_path = validate_file_path(args.file)
+        # Validate every file before uploading any of them
+        validated_paths = [validate_file_path(path) for path in args.file]
         
-        # Upload document
-        result = upload_document(
+        # Upload documents
+        upload_documents(
             org_id=args.org_id,
             user_id=args.user_id,
             mentor_id=args.mentor_id,
-            file_path=validated_path,
+            file_paths=validated_paths,
             api_key=api_key,
             base_url=args.base_url,
-            timeout=args.timeout
+            timeout=args.timeout,
+            use_cache=not args.force,
+            assume_idempotent=args.assume_idempotent,
+            max_workers=args.jobs
         )
         
-        logger.info("=" * 60)
-        logger.info("Script completed successfully!")
-        logger.info("=" * 60)
+        logger.info("\n".join([
+            "=" * 60,
+            "Script completed successfully!",
+            "=" * 60,
+        ]))
         return 0
         
     except ConfigurationError as e:
@@ -1,15 +1,23 @@
-import requests
-import os
+import logging
+
+# The upload logic lives in addFile.py - this script just walks through it
+from addFile import (
+    ConfigurationError, DocumentUploadError,
+    load_api_key, upload_document, validate_file_path
+)
+
+# Show the progress messages from addFile.py
+logging.basicConfig(level=logging.INFO, format='%(message)s')
 
 # ================================================
 # STEP 1: Load your API key from the text file
 # ================================================
+# (The MENTORAI_API_KEY environment variable is used instead, if set)
 try:
-    with open('api_credentials.txt', 'r') as f:
-        api_key = f.readline().strip()
+    api_key = load_api_key('api_credentials.txt')
     print("✅ API key loaded")
-except FileNotFoundError:
-    print("❌ Error: api_credentials.txt not found")
+except ConfigurationError as e:
+    print(f"❌ Error: {e}")
     exit()
 
 # ================================================
@@ -20,100 +28,54 @@ user_id = "jasidel"                                   # YOUR NetID - change this
 mentor_id = "25223e76-fc94-4cc2-aec1-f9fb51f0c2bf"   # Your mentor ID from URL
 file_path = "We Are All Confident Idiots.pdf"        # File to upload
 
-# ================================================
-# STEP 3: Build the API endpoint URL
-# ================================================
-url = f"https://base.manager.ai.syr.edu/api/ai-index/orgs/{org_id}/users/{user_id}/documents/train/"
-
-# ================================================
-# STEP 4: Set up authentication
-# ================================================
-headers = {
-    'Authorization': f'Api-Token {api_key}'
-}
-# NOTE: We DON'T set Content-Type here - Python does it automatically
-
 print(f"🔄 Uploading file: {file_path}")
-print(f"To mentor: {mentor_id}")
-print(f"URL: {url}\n")
+print(f"To mentor: {mentor_id}\n")
 
 # ================================================
-# STEP 5: Check if file exists
+# STEP 3: Check if file exists
 # ================================================
-if not os.path.exists(file_path):
-    print(f"❌ Error: File not found: {file_path}")
-    print(f"Current directory: {os.getcwd()}")
+try:
+    validated_path = validate_file_path(file_path)
+except ConfigurationError as e:
+    print(f"❌ Error: {e}")
     exit()
 
 # ================================================
-# STEP 6: Upload the file
+# STEP 4: Upload the file
 # ================================================
+# upload_document builds the API endpoint URL, sets up authentication,
+# streams the file as multipart form data and retries temporary failures
 try:
-    # Open file in binary read mode
-    with open(file_path, 'rb') as f:
-        
-        # Prepare the file for upload (multipart format)
-        files = {
-            'file': (os.path.basename(file_path), f, 'application/pdf')
-            # Format: (filename, file_object, mime_type)
-        }
-        
-        # Prepare other form fields
-        data = {
-            'pathway': mentor_id,  # Which mentor to train
-            'type': 'pdf',         # File type
-            'access': 'private'    # Visibility setting
-        }
-        
-        # Make the API request
-        # files= sends the file as multipart
-        # data= sends other fields along with it
-        response = requests.post(url, headers=headers, files=files, data=data)
-        
-        # ================================================
-        # STEP 7: Check what happened
-        # ================================================
-        
-        if response.status_code in [200, 201]:
-            # Success!
-            result = response.json()
-            print("✅ SUCCESS!")
-            print("=" * 60)
-            print(f"Message: {result.get('message', 'N/A')}")
-            print(f"Task ID: {result.get('task_id', 'N/A')}")
-            print(f"Document ID: {result.get('document_id', 'N/A')}")
-            print("=" * 60)
-            print("\nYour mentor is now learning from this PDF!")
-        
-        elif response.status_code == 400:
-            # Bad request - something wrong with what we sent
-            print("❌ ERROR: 400 Bad Request")
-            print(f"Response: {response.text}")
-            print("\nCheck: pathway ID, file type, or other parameters")
-        
-        elif response.status_code == 401:
-            # Unauthorized - API key problem
-            print("❌ ERROR: 401 Unauthorized")
-            print(f"Response: {response.text}")
-            print("\nCheck: Your API key in api_credentials.txt")
-        
-        elif response.status_code == 404:
-            # Not found - wrong URL or IDs
-            print("❌ ERROR: 404 Not Found")
-            print(f"Response: {response.text}")
-            print("\nCheck: org_id, user_id, or mentor_id")
-        
-        elif response.status_code == 413:
-            # File too large
-            print("❌ ERROR: 413 File Too Large")
-            print(f"Response: {response.text}")
-        
-        else:
-            # Some other error
-            print(f"❌ ERROR: {response.status_code}")
-            print(f"Response: {response.text}")
-            
-except FileNotFoundError:
-    print(f"❌ Error: Could not open file: {file_path}")
+    result = upload_document(
+        org_id=org_id,          # Your organization
+        user_id=user_id,        # Your NetID
+        mentor_id=mentor_id,    # Which mentor to train
+        file_path=validated_path,
+        api_key=api_key,
+        access='private',       # Visibility setting
+        use_cache=False         # Always send the file, even if sent before
+    )
+
+    # ================================================
+    # STEP 5: Check what happened
+    # ================================================
+
+    # Success!
+    print("✅ SUCCESS!")
+    print("=" * 60)
+    print(f"Message: {result.get('message', 'N/A')}")
+    print(f"Task ID: {result.get('task_id', 'N/A')}")
+    print(f"Document ID: {result.get('document_id', 'N/A')}")
+    print("=" * 60)
+    print("\nYour mentor is now learning from this file!")
+
+except DocumentUploadError as e:
+    # The error message includes the HTTP status code and server response
+    print(f"❌ ERROR: {e}")
+    print("\nCommon causes:")
+    print("  400 Bad Request  - check pathway ID, file type, or other parameters")
+    print("  401 Unauthorized - check your API key in api_credentials.txt")
+    print("  404 Not Found    - check org_id, user_id, or mentor_id")
+    print("  413 Too Large    - the file is too large for the server")
 except Exception as e:
     print(f"❌ Unexpected error: {e}")